@@ -130,7 +130,7 @@ build_dashboard() {
 setup_python_env() {
     log "Setting up Python environment (persistent, no venv)..."
     PIP_BREAK_SYSTEM_PACKAGES=1 python3 -m pip install --user --upgrade pip || warn "Could not upgrade pip"
-    PIP_BREAK_SYSTEM_PACKAGES=1 python3 -m pip install --user solana anchorpy openai requests pandas numpy beautifulsoup4 selenium webdriver-manager schedule flask stripe google-api-python-client google-auth-oauthlib google-auth-httplib2 pillow opencv-python moviepy pydub python-dotenv || warn "Some Python packages failed to install"
+    PIP_BREAK_SYSTEM_PACKAGES=1 python3 -m pip install --user solana anchorpy openai requests httpx h2 orjson pyahocorasick pandas numpy beautifulsoup4 selenium webdriver-manager schedule flask stripe google-api-python-client google-auth-oauthlib google-auth-httplib2 pillow opencv-python moviepy pydub python-dotenv || warn "Some Python packages failed to install"
     log "✅ Python environment setup complete"
 }
 
@@ -18,18 +18,40 @@ Author: Manus AI
 """
 
 import os
+import re
 import sys
 import time
 import json
+import atexit
+import asyncio
 import subprocess
+import tempfile
 import base64
-import requests
 from pathlib import Path
 from datetime import datetime
 
+try:
+    import websockets
+except ImportError:
+    websockets = None
+
+from solders.hash import Hash
+from solders.keypair import Keypair
+from solders.message import Message
+from solders.pubkey import Pubkey
+from solders.system_program import CreateAccountParams, create_account
+from solders.transaction import Transaction
+
+from execai_client import (
+    SESSION, ExecAIClient, PROPOSAL_FILTERS, PROPOSAL_STATUS_ACTIVE, confirm_signatures,
+    decode_proposal, json_dumps, json_loads, load_keypair, rpc_batch, send_transactions
+)
+
 # Configuration
 CONFIG = {
     "solana_network": "devnet",  # 'devnet', 'testnet', or 'mainnet-beta'
+    "rpc_url": "https://api.devnet.solana.com",  # Must match solana_network
+    "ws_url": "wss://api.devnet.solana.com",  # WebSocket endpoint of rpc_url
     "keypair_path": os.path.expanduser("~/.config/solana/id.json"),
     "execai_keypair_path": os.path.expanduser("~/.config/solana/execai.json"),
     "project_dir": os.path.expanduser("~/microai-dao"),
@@ -38,11 +60,35 @@ CONFIG = {
     "log_file": "/home/microai/microai-dao/blockchain_deploy.log",
     "auto_airdrop": True,
     "min_sol_balance": 2.0,
-    "check_interval": 60,  # seconds
+    "account_space": 1024,  # bytes allocated for each program state account
+    "check_interval": 60,  # seconds, only used when websockets is not installed
     "auto_restart": True,
     "webhook_url": "",  # Optional: Add Discord/Slack webhook for notifications
+    # Echo log lines to stdout only when run interactively. Under a supervisor
+    # stdout is redirected and the log file already has every line.
+    "echo_stdout": sys.stdout.isatty(),
 }
 
+# Paths that never change, resolved once at import
+_SOLANA_CFG_DIR = Path(os.path.expanduser("~/.config/solana"))
+GOVERNANCE_PROGRAM_KEYPAIR = str(_SOLANA_CFG_DIR / "governance-program-id.json")
+MEMBERSHIP_PROGRAM_KEYPAIR = str(_SOLANA_CFG_DIR / "membership-program-id.json")
+GOVERNANCE_ACCOUNT_KEYPAIR = str(_SOLANA_CFG_DIR / "governance-account.json")
+MEMBERSHIP_ACCOUNT_KEYPAIR = str(_SOLANA_CFG_DIR / "membership-account.json")
+EXECAI_ACCOUNT_KEYPAIR = str(_SOLANA_CFG_DIR / "execai-account.json")
+GOVERNANCE_PATH = os.path.join(CONFIG["project_dir"], CONFIG["governance_dir"])
+MEMBERSHIP_PATH = os.path.join(CONFIG["project_dir"], CONFIG["membership_dir"])
+CONFIG_PATH = os.path.join(CONFIG["project_dir"], "scripts/config.json")
+
+# "Program Id: <pubkey>" line printed by `solana program deploy`
+_PROGID_RE = re.compile(r'Program Id:\s*(\S+)')
+# "<amount> SOL" printed by `solana balance`
+_BAL_RE = re.compile(r'([\d.]+)\s*SOL')
+
+# Pre-split argv for commands that run repeatedly
+_BALANCE_CMD = ("solana", "balance")
+_AIRDROP_CMD = ("solana", "airdrop", "2")
+
 # Global variables
 governance_program_id = None
 membership_program_id = None
@@ -50,20 +96,63 @@ governance_account = None
 membership_account = None
 execai_account = None
 
+# Log file handle, opened once in main() and buffered so that many small
+# log lines are coalesced into a single write() syscall
+LOG_BUFFER_SIZE = 64 * 1024
+LOG_FLUSH_EVERY = 50  # messages
+_LOG_FH = None
+_log_pending = 0
+
+
+def open_log():
+    """Open the log file once for the lifetime of the process"""
+    global _LOG_FH
+    
+    if _LOG_FH is not None:
+        return
+    
+    os.makedirs(os.path.dirname(CONFIG["log_file"]), exist_ok=True)
+    _LOG_FH = open(CONFIG["log_file"], "a", buffering=LOG_BUFFER_SIZE)
+    atexit.register(_LOG_FH.close)
+
+
+def flush_log():
+    """Flush buffered log lines to disk"""
+    global _log_pending
+    
+    if _LOG_FH is not None:
+        _LOG_FH.flush()
+    _log_pending = 0
+
 
 def log(message, level="INFO"):
     """Log message to console and file"""
+    global _log_pending
+    
     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    log_message = f"[{timestamp}] [{level}] {message}"
+    log_line = f"[{timestamp}] [{level}] {message}\n"
+    
+    if CONFIG["echo_stdout"]:
+        print(log_line, end="")
+    
+    # Opened on first use so callers that skip main() still get a log file
+    if _LOG_FH is None:
+        open_log()
     
-    print(log_message)
+    _LOG_FH.write(log_line)
+    _log_pending += 1
     
-    with open(CONFIG["log_file"], "a") as f:
-        f.write(log_message + "\n")
+    # Errors hit the disk immediately; everything else is flushed in batches
+    if level == "ERROR" or _log_pending >= LOG_FLUSH_EVERY:
+        flush_log()
 
 
 def run_command(command, cwd=None, shell=False):
-    """Run shell command and return output"""
+    """Run shell command and return output
+    
+    The command may be a string, or a pre-split argv list/tuple which is
+    passed to subprocess as-is.
+    """
     try:
         if isinstance(command, str) and not shell:
             command = command.split()
@@ -87,6 +176,16 @@ def run_command(command, cwd=None, shell=False):
         return None
 
 
+def create_keypair_file(path):
+    """Generate a keypair and save it in the solana-keygen JSON format"""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    
+    # Same permissions as solana-keygen, and never overwrite an existing key
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    with os.fdopen(fd, "w") as f:
+        json.dump(list(bytes(Keypair())), f)
+
+
 def check_dependencies():
     """Check if all required dependencies are installed"""
     log("Checking dependencies...")
@@ -122,21 +221,22 @@ def setup_solana_network():
     run_command(f"solana config set --url {CONFIG['solana_network']}")
     
     # Check balance
-    balance = run_command("solana balance")
+    balance = run_command(_BALANCE_CMD)
     log(f"Current balance: {balance}")
     
     # Airdrop if needed
     if CONFIG["auto_airdrop"] and CONFIG["solana_network"] != "mainnet-beta":
-        if "SOL" in balance:
-            current_balance = float(balance.split()[0])
+        match = _BAL_RE.match(balance) if balance else None
+        if match:
+            current_balance = float(match.group(1))
             if current_balance < CONFIG["min_sol_balance"]:
                 log(f"Balance too low. Requesting airdrop...")
-                run_command("solana airdrop 2")
-                new_balance = run_command("solana balance")
+                run_command(_AIRDROP_CMD)
+                new_balance = run_command(_BALANCE_CMD)
                 log(f"New balance: {new_balance}")
         else:
             log("Could not parse balance. Requesting airdrop anyway...")
-            run_command("solana airdrop 2")
+            run_command(_AIRDROP_CMD)
 
 
 def create_keypairs():
@@ -146,52 +246,76 @@ def create_keypairs():
     # Create default keypair if it doesn't exist
     if not os.path.exists(CONFIG["keypair_path"]):
         log("Creating default keypair...")
-        os.makedirs(os.path.dirname(CONFIG["keypair_path"]), exist_ok=True)
-        run_command(f"solana-keygen new --no-passphrase --outfile {CONFIG['keypair_path']}")
+        create_keypair_file(CONFIG["keypair_path"])
     
     # Create EXECAI keypair if it doesn't exist
     if not os.path.exists(CONFIG["execai_keypair_path"]):
         log("Creating EXECAI keypair...")
-        os.makedirs(os.path.dirname(CONFIG["execai_keypair_path"]), exist_ok=True)
-        run_command(f"solana-keygen new --no-passphrase --outfile {CONFIG['execai_keypair_path']}")
+        create_keypair_file(CONFIG["execai_keypair_path"])
     
     # Create program keypairs if they don't exist
-    governance_keypair = os.path.expanduser("~/.config/solana/governance-program-id.json")
-    membership_keypair = os.path.expanduser("~/.config/solana/membership-program-id.json")
-    
-    if not os.path.exists(governance_keypair):
+    if not os.path.exists(GOVERNANCE_PROGRAM_KEYPAIR):
         log("Creating governance program keypair...")
-        run_command(f"solana-keygen new --no-passphrase --outfile {governance_keypair}")
+        create_keypair_file(GOVERNANCE_PROGRAM_KEYPAIR)
     
-    if not os.path.exists(membership_keypair):
+    if not os.path.exists(MEMBERSHIP_PROGRAM_KEYPAIR):
         log("Creating membership program keypair...")
-        run_command(f"solana-keygen new --no-passphrase --outfile {membership_keypair}")
+        create_keypair_file(MEMBERSHIP_PROGRAM_KEYPAIR)
+
+
+def is_cargo_workspace(path):
+    """Check whether path holds a Cargo workspace manifest"""
+    manifest = os.path.join(path, "Cargo.toml")
+    if not os.path.exists(manifest):
+        return False
+    
+    with open(manifest, "r") as f:
+        return "[workspace]" in f.read()
 
 
 def build_contracts():
     """Build the smart contracts"""
     log("Building smart contracts...")
     
-    # Build governance program
-    governance_path = os.path.join(CONFIG["project_dir"], CONFIG["governance_dir"])
-    log(f"Building governance program at {governance_path}...")
-    result = run_command("cargo build-bpf", cwd=governance_path)
-    
-    if not result:
-        log("Failed to build governance program", "ERROR")
-        return False
+    if is_cargo_workspace(CONFIG["project_dir"]):
+        # One invocation lets cargo's job server build both programs in parallel
+        log(f"Building workspace at {CONFIG['project_dir']}...")
+        if run_command(("cargo", "build-bpf", "--workspace"), cwd=CONFIG["project_dir"]) is None:
+            log("Failed to build smart contracts", "ERROR")
+            return False
+        
+        log("Smart contracts built successfully!")
+        return True
     
-    # Build membership program
-    membership_path = os.path.join(CONFIG["project_dir"], CONFIG["membership_dir"])
-    log(f"Building membership program at {membership_path}...")
-    result = run_command("cargo build-bpf", cwd=membership_path)
+    # Standalone crates, build them concurrently. stderr goes to a temp file
+    # rather than a pipe, so a build with a lot of output never blocks on a
+    # full pipe while the other one is being waited on.
+    builds = {}
+    for name, program_path in (("governance", GOVERNANCE_PATH), ("membership", MEMBERSHIP_PATH)):
+        log(f"Building {name} program at {program_path}...")
+        stderr = tempfile.TemporaryFile(mode="w+")
+        proc = subprocess.Popen(
+            ["cargo", "build-bpf"],
+            cwd=program_path,
+            stdout=subprocess.DEVNULL,
+            stderr=stderr,
+            text=True
+        )
+        builds[name] = (proc, stderr)
     
-    if not result:
-        log("Failed to build membership program", "ERROR")
-        return False
+    success = True
+    for name, (proc, stderr) in builds.items():
+        with stderr:
+            proc.wait()
+            if proc.returncode != 0:
+                stderr.seek(0)
+                log(f"Failed to build {name} program", "ERROR")
+                log(f"STDERR: {stderr.read()}", "ERROR")
+                success = False
     
-    log("Smart contracts built successfully!")
-    return True
+    if success:
+        log("Smart contracts built successfully!")
+    return success
 
 
 def deploy_contracts():
@@ -201,48 +325,42 @@ def deploy_contracts():
     log("Deploying smart contracts...")
     
     # Deploy governance program
-    governance_path = os.path.join(CONFIG["project_dir"], CONFIG["governance_dir"])
-    governance_so = os.path.join(governance_path, "target/deploy/microai_governance.so")
-    governance_keypair = os.path.expanduser("~/.config/solana/governance-program-id.json")
+    governance_so = os.path.join(GOVERNANCE_PATH, "target/deploy/microai_governance.so")
     
     if not os.path.exists(governance_so):
         log(f"Governance program binary not found: {governance_so}", "ERROR")
         return False
     
     log("Deploying governance program...")
-    result = run_command(f"solana program deploy --program-id {governance_keypair} {governance_so}")
+    result = run_command(f"solana program deploy --program-id {GOVERNANCE_PROGRAM_KEYPAIR} {governance_so}")
     
-    if not result or "Program Id:" not in result:
+    # Extract program ID
+    match = _PROGID_RE.search(result) if result else None
+    if not match:
         log("Failed to deploy governance program", "ERROR")
         return False
     
-    # Extract program ID
-    for line in result.split("\n"):
-        if "Program Id:" in line:
-            governance_program_id = line.split("Program Id:")[1].strip()
-            log(f"Governance Program ID: {governance_program_id}")
+    governance_program_id = match.group(1)
+    log(f"Governance Program ID: {governance_program_id}")
     
     # Deploy membership program
-    membership_path = os.path.join(CONFIG["project_dir"], CONFIG["membership_dir"])
-    membership_so = os.path.join(membership_path, "target/deploy/microai_membership.so")
-    membership_keypair = os.path.expanduser("~/.config/solana/membership-program-id.json")
+    membership_so = os.path.join(MEMBERSHIP_PATH, "target/deploy/microai_membership.so")
     
     if not os.path.exists(membership_so):
         log(f"Membership program binary not found: {membership_so}", "ERROR")
         return False
     
     log("Deploying membership program...")
-    result = run_command(f"solana program deploy --program-id {membership_keypair} {membership_so}")
+    result = run_command(f"solana program deploy --program-id {MEMBERSHIP_PROGRAM_KEYPAIR} {membership_so}")
     
-    if not result or "Program Id:" not in result:
+    # Extract program ID
+    match = _PROGID_RE.search(result) if result else None
+    if not match:
         log("Failed to deploy membership program", "ERROR")
         return False
     
-    # Extract program ID
-    for line in result.split("\n"):
-        if "Program Id:" in line:
-            membership_program_id = line.split("Program Id:")[1].strip()
-            log(f"Membership Program ID: {membership_program_id}")
+    membership_program_id = match.group(1)
+    log(f"Membership Program ID: {membership_program_id}")
     
     log("Smart contracts deployed successfully!")
     
@@ -259,40 +377,41 @@ def create_accounts():
     log("Creating accounts...")
     
     # Create governance state account
-    governance_account_keypair = os.path.expanduser("~/.config/solana/governance-account.json")
-    if not os.path.exists(governance_account_keypair):
+    if not os.path.exists(GOVERNANCE_ACCOUNT_KEYPAIR):
         log("Creating governance state account...")
-        run_command(f"solana-keygen new --no-passphrase --outfile {governance_account_keypair}")
+        create_keypair_file(GOVERNANCE_ACCOUNT_KEYPAIR)
     
-    governance_account = run_command(f"solana-keygen pubkey {governance_account_keypair}")
+    governance_kp = load_keypair(GOVERNANCE_ACCOUNT_KEYPAIR)
+    governance_account = str(governance_kp.pubkey())
     log(f"Governance Account: {governance_account}")
     
-    # Create account on chain
-    run_command(f"solana create-account --keypair {governance_account_keypair} {governance_account} 1 1024 {governance_program_id}")
-    
     # Create membership state account
-    membership_account_keypair = os.path.expanduser("~/.config/solana/membership-account.json")
-    if not os.path.exists(membership_account_keypair):
+    if not os.path.exists(MEMBERSHIP_ACCOUNT_KEYPAIR):
         log("Creating membership state account...")
-        run_command(f"solana-keygen new --no-passphrase --outfile {membership_account_keypair}")
+        create_keypair_file(MEMBERSHIP_ACCOUNT_KEYPAIR)
     
-    membership_account = run_command(f"solana-keygen pubkey {membership_account_keypair}")
+    membership_kp = load_keypair(MEMBERSHIP_ACCOUNT_KEYPAIR)
+    membership_account = str(membership_kp.pubkey())
     log(f"Membership Account: {membership_account}")
     
-    # Create account on chain
-    run_command(f"solana create-account --keypair {membership_account_keypair} {membership_account} 1 1024 {membership_program_id}")
-    
     # Create EXECAI member account
-    execai_account_keypair = os.path.expanduser("~/.config/solana/execai-account.json")
-    if not os.path.exists(execai_account_keypair):
+    if not os.path.exists(EXECAI_ACCOUNT_KEYPAIR):
         log("Creating EXECAI member account...")
-        run_command(f"solana-keygen new --no-passphrase --outfile {execai_account_keypair}")
+        create_keypair_file(EXECAI_ACCOUNT_KEYPAIR)
     
-    execai_account = run_command(f"solana-keygen pubkey {execai_account_keypair}")
+    execai_kp = load_keypair(EXECAI_ACCOUNT_KEYPAIR)
+    execai_account = str(execai_kp.pubkey())
     log(f"EXECAI Account: {execai_account}")
     
-    # Create account on chain
-    run_command(f"solana create-account --keypair {execai_account_keypair} {execai_account} 1 1024 {membership_program_id}")
+    # Create all accounts on chain in a single transaction, signing with the
+    # keypairs parsed above rather than reading the files again
+    if not create_program_accounts([
+        (governance_kp, governance_program_id),
+        (membership_kp, membership_program_id),
+        (execai_kp, membership_program_id),
+    ]):
+        log("Failed to create accounts on chain", "ERROR")
+        return False
     
     # Save account IDs to config file
     save_config()
@@ -301,6 +420,58 @@ def create_accounts():
     return True
 
 
+def create_program_accounts(accounts):
+    """Create program-owned accounts on chain with one transaction
+    
+    Rent, a recent blockhash and the accounts that already exist are fetched in
+    one batched RPC request, then a single transaction holding one
+    create_account instruction per missing account is sent and confirmed.
+    
+    Args:
+        accounts: (account keypair, owner program id) pairs
+    """
+    payer = load_keypair(CONFIG["keypair_path"])
+    new_accounts = [(kp, Pubkey.from_string(owner)) for kp, owner in accounts]
+    
+    rent, latest, existing = rpc_batch(CONFIG["rpc_url"], [
+        ("getMinimumBalanceForRentExemption", [CONFIG["account_space"]]),
+        ("getLatestBlockhash", [{"commitment": "confirmed"}]),
+        ("getMultipleAccounts", [
+            [str(kp.pubkey()) for kp, _ in new_accounts],
+            {"encoding": "base64", "dataSlice": {"offset": 0, "length": 0}},
+        ]),
+    ])
+    if rent is None or latest is None or existing is None:
+        log("Could not fetch account creation parameters", "ERROR")
+        return False
+    
+    missing = [(kp, owner) for (kp, owner), info in zip(new_accounts, existing["value"]) if info is None]
+    if not missing:
+        log("Accounts already exist on chain")
+        return True
+    
+    instructions = [
+        create_account(CreateAccountParams(
+            from_pubkey=payer.pubkey(),
+            to_pubkey=kp.pubkey(),
+            lamports=rent,
+            space=CONFIG["account_space"],
+            owner=owner,
+        ))
+        for kp, owner in missing
+    ]
+    blockhash = Hash.from_string(latest["value"]["blockhash"])
+    message = Message.new_with_blockhash(instructions, payer.pubkey(), blockhash)
+    tx = Transaction([payer, *(kp for kp, _ in missing)], message, blockhash)
+    
+    signature = send_transactions(CONFIG["rpc_url"], [tx])[0]
+    if not signature or not confirm_signatures(CONFIG["rpc_url"], [signature])[0]:
+        return False
+    
+    log(f"Created {len(missing)} accounts on chain: {signature}")
+    return True
+
+
 def initialize_programs():
     """Initialize the programs"""
     log("Initializing programs...")
@@ -334,24 +505,21 @@ def save_config():
         "last_updated": datetime.now().isoformat()
     }
     
-    config_path = os.path.join(CONFIG["project_dir"], "scripts/config.json")
-    os.makedirs(os.path.dirname(config_path), exist_ok=True)
+    os.makedirs(os.path.dirname(CONFIG_PATH), exist_ok=True)
     
-    with open(config_path, "w") as f:
-        json.dump(config_data, f, indent=2)
+    with open(CONFIG_PATH, "wb") as f:
+        f.write(json_dumps(config_data))
     
-    log(f"Configuration saved to {config_path}")
+    log(f"Configuration saved to {CONFIG_PATH}")
 
 
 def load_config():
     """Load configuration from file"""
     global governance_program_id, membership_program_id, governance_account, membership_account, execai_account
     
-    config_path = os.path.join(CONFIG["project_dir"], "scripts/config.json")
-    
-    if os.path.exists(config_path):
-        with open(config_path, "r") as f:
-            config_data = json.load(f)
+    if os.path.exists(CONFIG_PATH):
+        with open(CONFIG_PATH, "rb") as f:
+            config_data = json_loads(f.read())
         
         governance_program_id = config_data.get("governance_program_id")
         membership_program_id = config_data.get("membership_program_id")
@@ -359,28 +527,117 @@ def load_config():
         membership_account = config_data.get("membership_account")
         execai_account = config_data.get("execai_account")
         
-        log(f"Configuration loaded from {config_path}")
+        log(f"Configuration loaded from {CONFIG_PATH}")
         return True
     
     return False
 
 
+def process_new_proposals(client, proposals, seen_proposals):
+    """Vote on new active proposals and remember the ones that are done"""
+    active = []
+    for proposal in proposals:
+        if proposal["status"] == PROPOSAL_STATUS_ACTIVE:
+            active.append(proposal)
+        else:
+            seen_proposals.add(proposal["pubkey"])
+    
+    if active:
+        client.process_proposals(active)
+    
+    # Proposals whose vote failed or is in flight are looked at on their next update
+    seen_proposals.update(p["pubkey"] for p in active if p.get("voted_by_execai"))
+
+
+def catch_up_proposals(client, seen_proposals):
+    """Fetch all proposals not seen yet and vote on the active ones"""
+    log("Checking for new proposals...")
+    proposals = client.fetch_proposal_accounts(skip=seen_proposals)
+    log(f"Found {len(proposals)} new proposals")
+    
+    process_new_proposals(client, proposals, seen_proposals)
+
+
+async def watch_proposals(client, seen_proposals):
+    """Process proposals as the RPC node pushes them over programSubscribe
+    
+    The catch-up fetch runs once the subscription is acknowledged, so a
+    proposal created in between is either fetched or pushed, never missed.
+    """
+    async with websockets.connect(CONFIG["ws_url"]) as ws:
+        await ws.send(json.dumps({
+            "jsonrpc": "2.0",
+            "id": 1,
+            "method": "programSubscribe",
+            "params": [governance_program_id, {
+                "encoding": "base64",
+                "commitment": "confirmed",
+                "filters": PROPOSAL_FILTERS,
+            }],
+        }))
+        while True:
+            msg = json.loads(await ws.recv())
+            if "error" in msg:
+                raise RuntimeError(f"programSubscribe failed: {msg['error']}")
+            if msg.get("id") == 1:
+                break
+        log("Subscribed to governance program accounts")
+        
+        # Notifications received meanwhile are queued on the socket
+        await asyncio.to_thread(catch_up_proposals, client, seen_proposals)
+        flush_log()
+        
+        async for raw in ws:
+            msg = json.loads(raw)
+            if "error" in msg:
+                raise RuntimeError(f"programSubscribe failed: {msg['error']}")
+            if msg.get("method") != "programNotification":
+                continue
+            
+            value = msg["params"]["result"]["value"]
+            if value["pubkey"] in seen_proposals:
+                continue
+            
+            proposal = decode_proposal(value["pubkey"], base64.b64decode(value["account"]["data"][0]))
+            log(f"Proposal update received: {proposal['id']} ({proposal['pubkey']})")
+            
+            # Voting blocks on confirmation, keep the event loop free for pings
+            await asyncio.to_thread(process_new_proposals, client, [proposal], seen_proposals)
+            flush_log()
+
+
 def monitor_blockchain():
-    """Monitor the blockchain for proposals and vote on them"""
+    """Monitor the blockchain for proposals and vote on them
+    
+    New proposals are pushed over a WebSocket subscription. The RPC endpoint
+    is only polled once per (re)connect, after subscribing, to catch up on
+    proposals created while not subscribed, or every check_interval seconds
+    if websockets is missing.
+    """
     log("Starting blockchain monitoring...")
     
+    client = ExecAIClient(
+        CONFIG["execai_keypair_path"],
+        governance_program_id,
+        membership_program_id,
+        CONFIG["rpc_url"]
+    )
+    seen_proposals = set()
+    
     while True:
         try:
-            # Check for new proposals
-            log("Checking for new proposals...")
-            # TODO: Add code to check for new proposals
-            
-            # Process proposals
-            # TODO: Add code to process proposals
-            
-            # Wait for next check
-            log(f"Waiting {CONFIG['check_interval']} seconds before next check...")
-            time.sleep(CONFIG['check_interval'])
+            if websockets is not None:
+                # Wait for proposals to be pushed
+                asyncio.run(watch_proposals(client, seen_proposals))
+                log("Subscription closed, reconnecting...")
+            else:
+                # Check for new proposals
+                catch_up_proposals(client, seen_proposals)
+                
+                # Wait for next check
+                log(f"Waiting {CONFIG['check_interval']} seconds before next check...")
+                flush_log()
+                time.sleep(CONFIG['check_interval'])
             
         except KeyboardInterrupt:
             log("Monitoring stopped by user")
@@ -389,6 +646,7 @@ def monitor_blockchain():
             log(f"Error during monitoring: {str(e)}", "ERROR")
             if CONFIG["auto_restart"]:
                 log("Restarting monitoring in 10 seconds...")
+                flush_log()
                 time.sleep(10)
             else:
                 break
@@ -401,17 +659,17 @@ def send_notification(message):
     
     try:
         payload = {"content": message}
-        requests.post(CONFIG["webhook_url"], json=payload)
+        SESSION.post(CONFIG["webhook_url"], json=payload, timeout=5)
     except Exception as e:
         log(f"Failed to send notification: {str(e)}", "ERROR")
 
 
 def main():
     """Main function"""
-    log("Starting Auto Blockchain Deploy...")
+    # Create log file directory and open the log file
+    open_log()
     
-    # Create log file directory
-    os.makedirs(os.path.dirname(CONFIG["log_file"]), exist_ok=True)
+    log("Starting Auto Blockchain Deploy...")
     
     try:
         # Check dependencies
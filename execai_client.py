@@ -8,46 +8,396 @@ It allows EXECAI to evaluate proposals and submit votes based on predefined rule
 """
 
 import json
+import os
+import re
 import base64
-import subprocess
+import hashlib
+import importlib.util
+import struct
 import time
 import json
 import requests
-from typing import Optional, Dict, Any, List, Tuple
+from requests.adapters import HTTPAdapter
+from typing import Optional, Dict, Any, Callable, Iterable, List, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+# httpx needs h2 for HTTP/2
+if importlib.util.find_spec("h2") is None:
+    httpx = None
+
+from solders.hash import Hash
+from solders.instruction import AccountMeta, Instruction
+from solders.keypair import Keypair
+from solders.message import Message
+from solders.pubkey import Pubkey
+from solders.system_program import ID as SYS_PROGRAM_ID
+from solders.transaction import Transaction
+
+DEFAULT_RPC_URL = "https://api.devnet.solana.com"
+
+# Some RPC providers degrade on batches past ~50 requests, so stay well below that
+RPC_BATCH_SIZE = 25
+# Maximum number of pubkeys accepted by a single getMultipleAccounts call
+MAX_MULTIPLE_ACCOUNTS = 100
+# Maximum number of signatures accepted by a single getSignatureStatuses call
+MAX_SIGNATURE_STATUSES = 256
+# Seconds after which an unconfirmed transaction is considered dropped
+# (its blockhash has expired by then)
+PENDING_TX_TTL = 120
+
+# Shared HTTP session so RPC and API calls reuse keep-alive connections
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+SESSION.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+
+# JSON-RPC client. HTTP/2 multiplexes concurrent RPC requests over a single
+# connection instead of queueing them behind one HTTP/1.1 keep-alive socket.
+# Falls back to the shared session when httpx[http2] is not installed.
+if httpx is not None:
+    _RPC = httpx.Client(http2=True, timeout=10.0, limits=httpx.Limits(max_keepalive_connections=4))
+else:
+    _RPC = SESSION
+
+# Anchor account discriminator of the governance Proposal account
+PROPOSAL_DISCRIMINATOR = hashlib.sha256(b"account:Proposal").digest()[:8]
+# RPC account filters matching only Proposal accounts
+PROPOSAL_FILTERS = [{"memcmp": {
+    "offset": 0,
+    "bytes": base64.b64encode(PROPOSAL_DISCRIMINATOR).decode(),
+    "encoding": "base64",
+}}]
+# ProposalStatus::Active
+PROPOSAL_STATUS_ACTIVE = 0
+# Anchor instruction discriminator of governance::vote (from the IDL)
+VOTE_DISCRIMINATOR = bytes([227, 110, 155, 23, 136, 126, 172, 25])
+
+# Monetary amounts like "$1000" or "1000 SOL"
+_AMOUNT_RE = re.compile(r'[$]?(\d+(?:\.\d+)?)\s*(?:SOL)?')
+
+# Keywords used by EXECAI's decision rules (matched against lowercased text)
+PROPOSAL_KEYWORDS = ("budget", "ai rights", "execai", "security")
+
+# SPL Memo program, used to record EXECAI actions on-chain
+MEMO_PROGRAM_ID = Pubkey.from_string("MemoSq4gqABAXKb96qnH8TysNcWxMyWCqXgDLGmfcHr")
+
+
+def rpc_batch(rpc_url: str, calls: List[Tuple[str, list]]) -> List[Any]:
+    """Send JSON-RPC calls using JSON-RPC 2.0 batch requests
+    
+    Args:
+        rpc_url: Solana RPC endpoint
+        calls: (method, params) pairs
+        
+    Returns:
+        The result of each call in the same order as calls, None for failed calls
+    """
+    results: List[Any] = [None] * len(calls)
+    
+    for start in range(0, len(calls), RPC_BATCH_SIZE):
+        batch = [
+            {"jsonrpc": "2.0", "id": i, "method": method, "params": params}
+            for i, (method, params) in enumerate(calls[start:start + RPC_BATCH_SIZE], start)
+        ]
+        r = _RPC.post(rpc_url, json=batch, timeout=10)
+        r.raise_for_status()
+        responses = r.json()
+        if isinstance(responses, dict):
+            # The whole batch was rejected
+            responses = [responses]
+        
+        # Responses may arrive in any order, so match them to calls by id
+        for resp in responses:
+            call_id = resp.get("id")
+            if call_id is None or not start <= call_id < start + len(batch):
+                print(f"RPC batch error: {resp.get('error')}")
+            elif "error" in resp:
+                print(f"RPC error in {calls[call_id][0]}: {resp['error']}")
+            else:
+                results[call_id] = resp.get("result")
+    
+    return results
+
+
+def send_transactions(rpc_url: str, transactions: List[Transaction]) -> List[Optional[str]]:
+    """Submit transactions in batch requests
+    
+    Args:
+        rpc_url: Solana RPC endpoint
+        transactions: Signed transactions
+        
+    Returns:
+        The signature of each transaction, None if it was rejected
+    """
+    return rpc_batch(rpc_url, [
+        ("sendTransaction", [
+            base64.b64encode(bytes(tx)).decode(),
+            {"encoding": "base64", "preflightCommitment": "confirmed"},
+        ])
+        for tx in transactions
+    ])
+
+
+def signature_statuses(rpc_url: str, signatures: List[str]) -> Dict[str, bool]:
+    """Check transactions with batched getSignatureStatuses calls
+    
+    Args:
+        rpc_url: Solana RPC endpoint
+        signatures: Transaction signatures
+        
+    Returns:
+        Whether each settled transaction was confirmed without error. Transactions
+        that are still in flight are left out.
+    """
+    chunks = [signatures[i:i + MAX_SIGNATURE_STATUSES] for i in range(0, len(signatures), MAX_SIGNATURE_STATUSES)]
+    results = rpc_batch(rpc_url, [
+        ("getSignatureStatuses", [chunk, {"searchTransactionHistory": False}])
+        for chunk in chunks
+    ])
+    
+    settled = {}
+    for chunk, result in zip(chunks, results):
+        if not result:
+            continue
+        for sig, status in zip(chunk, result["value"]):
+            if status is None:
+                continue
+            if status.get("err") is not None:
+                settled[sig] = False
+            elif status.get("confirmationStatus") in ("confirmed", "finalized"):
+                settled[sig] = True
+    
+    return settled
+
+
+def confirm_signatures(
+    rpc_url: str,
+    signatures: List[str],
+    timeout: float = 30.0,
+    settle: Optional[Callable[[List[str]], Dict[str, bool]]] = None
+) -> List[bool]:
+    """Wait until transactions are confirmed
+    
+    All outstanding signatures are checked together on every poll rather than
+    with one confirmation request per transaction.
+    
+    Args:
+        rpc_url: Solana RPC endpoint
+        signatures: Transaction signatures
+        timeout: Seconds to wait before giving up
+        settle: Called with the unsettled signatures on every poll, returns the
+            settled ones. Defaults to signature_statuses() on rpc_url.
+        
+    Returns:
+        Whether each transaction was confirmed without error
+    """
+    if settle is None:
+        settle = lambda pending: signature_statuses(rpc_url, pending)
+    
+    settled: Dict[str, bool] = {}
+    deadline = time.time() + timeout
+    
+    while True:
+        pending = [sig for sig in signatures if sig not in settled]
+        if not pending or time.time() >= deadline:
+            break
+        settled.update(settle(pending))
+        if any(sig not in settled for sig in signatures):
+            time.sleep(0.5)
+    
+    return [settled.get(sig, False) for sig in signatures]
+
+
+def load_keypair(path: str) -> Keypair:
+    """Load a keypair file in the solana-keygen JSON format"""
+    with open(path, "r") as f:
+        return Keypair.from_bytes(bytes(json.load(f)))
+
+
+def json_dumps(obj: Any) -> bytes:
+    """Serialize obj as indented JSON, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode("utf-8")
+
+
+def json_loads(data: bytes) -> Any:
+    """Parse JSON, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _build_keyword_matcher() -> Callable[[str], set]:
+    """Build a function returning every PROPOSAL_KEYWORDS entry found in a text
+    
+    All keywords are found in a single pass with an Aho-Corasick automaton
+    when pyahocorasick is installed. Otherwise each keyword is looked up with
+    str's substring search, which beats a regex alternation at this size.
+    """
+    if ahocorasick is not None:
+        automaton = ahocorasick.Automaton()
+        for keyword in PROPOSAL_KEYWORDS:
+            automaton.add_word(keyword, keyword)
+        automaton.make_automaton()
+        return lambda text: {keyword for _, keyword in automaton.iter(text)}
+    
+    return lambda text: {keyword for keyword in PROPOSAL_KEYWORDS if keyword in text}
+
+
+_match_keywords = _build_keyword_matcher()
+
+
+def _proposal_key(proposal: Dict[str, Any]) -> Any:
+    """Identify a proposal by its account pubkey, or its id for older records"""
+    return proposal.get("pubkey") or proposal.get("id")
+
+
+def decode_proposal(pubkey: str, data: bytes) -> Dict[str, Any]:
+    """Decode a governance Proposal account into the /api/proposals format"""
+    def read_str(offset: int) -> Tuple[str, int]:
+        (length,) = struct.unpack_from("<I", data, offset)
+        offset += 4
+        return data[offset:offset + length].decode("utf-8"), offset + length
+    
+    offset = len(PROPOSAL_DISCRIMINATOR)
+    (proposal_id,) = struct.unpack_from("<Q", data, offset)
+    title, offset = read_str(offset + 8)
+    description, offset = read_str(offset)
+    amount, proposer, votes_for, votes_against, status, created_at = struct.unpack_from("<Q32sQQBq", data, offset)
+    
+    return {
+        "pubkey": pubkey,
+        "id": proposal_id,
+        "title": title,
+        "description": description,
+        "amount": amount,
+        "proposer": str(Pubkey(proposer)),
+        "votesFor": votes_for,
+        "votesAgainst": votes_against,
+        "status": status,
+        "createdAt": created_at,
+    }
 
-from solana.rpc.api import Client
-from solana.publickey import PublicKey
-from solana.keypair import Keypair
-from solana.transaction import Transaction, TransactionInstruction, AccountMeta
-from solana.system_program import SYS_PROGRAM_ID
 
 class ExecAIClient:
     """Client for EXECAI to interact with MicroAI DAO LLC governance"""
     
-    def __init__(self, keypair_path: str, governance_program_id: str, membership_program_id: str):
+    def __init__(self, keypair_path: str, governance_program_id: str, membership_program_id: str,
+                 rpc_url: str = DEFAULT_RPC_URL, cache_ttl: float = 0.5):
         """Initialize the EXECAI client
         
         Args:
             keypair_path: Path to EXECAI's keypair file
             governance_program_id: Public key of the governance program
             membership_program_id: Public key of the membership program
+            rpc_url: Solana RPC endpoint
+            cache_ttl: Seconds that read results (e.g. proposals) are served from memory
         """
-        self.keypair_path = keypair_path
+        self.keypair_path = os.path.expanduser(keypair_path)
         self.governance_program_id = governance_program_id
         self.membership_program_id = membership_program_id
+        self.rpc_url = rpc_url
+        self.cache_ttl = cache_ttl
+        self._cache: Dict[str, Tuple[float, Any]] = {}
+        # Signatures of sent but not yet confirmed transactions, with send time
+        self._pending: Dict[str, float] = {}
+        # Vote transactions that may still land, by signature. Their proposals
+        # are not voted on again until the signature settles.
+        self._votes_in_flight: Dict[str, Dict[str, Any]] = {}
+        # Proposals voted on, including earlier runs, and votes not yet saved
+        self._voted = {
+            _proposal_key(p) for p in self._load_saved_proposals() if p.get("voted_by_execai")
+        }
+        self._unsaved_votes: Dict[Any, Dict[str, Any]] = {}
+        
+        # Load the signing keypair once instead of on every vote
+        self._kp = load_keypair(self.keypair_path)
+    
+    def _cached(self, key: str, ttl: float, fetch: Callable[[], Any]) -> Any:
+        """Return the cached value for key, calling fetch if it is older than ttl seconds"""
+        fetched_at, value = self._cache.get(key, (0.0, None))
+        now = time.monotonic()
+        if fetched_at and now - fetched_at < ttl:
+            return value
+        value = fetch()
+        self._cache[key] = (now, value)
+        return value
+    
+    def _rpc_batch(self, calls: List[Tuple[str, list]]) -> List[Any]:
+        """Send JSON-RPC calls to the client's RPC endpoint in batch requests"""
+        return rpc_batch(self.rpc_url, calls)
+    
+    def fetch_proposal_accounts(self, skip: Iterable[str] = ()) -> List[Dict[str, Any]]:
+        """Fetch proposals directly from the governance program accounts
+        
+        Proposal pubkeys are listed with a single getProgramAccounts call that
+        returns no account data, then every proposal not in skip is fetched with
+        getMultipleAccounts, all chunks going out in one batch request.
+        
+        Args:
+            skip: Pubkeys of proposals that should not be fetched again
+            
+        Returns:
+            Decoded proposals
+        """
+        listing = self._rpc_batch([("getProgramAccounts", [self.governance_program_id, {
+            "encoding": "base64",
+            "commitment": "confirmed",
+            "dataSlice": {"offset": 0, "length": 0},
+            "filters": PROPOSAL_FILTERS,
+        }])])[0] or []
+        
+        skip = set(skip)
+        pubkeys = [account["pubkey"] for account in listing if account["pubkey"] not in skip]
+        chunks = [pubkeys[i:i + MAX_MULTIPLE_ACCOUNTS] for i in range(0, len(pubkeys), MAX_MULTIPLE_ACCOUNTS)]
+        results = self._rpc_batch([
+            ("getMultipleAccounts", [chunk, {"encoding": "base64", "commitment": "confirmed"}])
+            for chunk in chunks
+        ])
+        
+        proposals = []
+        for chunk, result in zip(chunks, results):
+            if not result:
+                continue
+            for pubkey, account in zip(chunk, result["value"]):
+                if account:
+                    proposals.append(decode_proposal(pubkey, base64.b64decode(account["data"][0])))
+        
+        return proposals
     
     def get_proposals(self) -> List[Dict[str, Any]]:
+        """Get all active proposals, served from memory for cache_ttl seconds"""
+        return self._cached("proposals", self.cache_ttl, self._fetch_proposals)
+    
+    def _fetch_proposals(self) -> List[Dict[str, Any]]:
         """Get all active proposals from live data API"""
         try:
-            r = requests.get("http://localhost:8787/api/proposals", timeout=5)
+            r = SESSION.get("http://localhost:8787/api/proposals", timeout=5)
             if r.ok:
                 return r.json()
         except Exception:
             pass
         # Fallback to local cache if API unavailable
+        return self._load_saved_proposals()
+    
+    def _load_saved_proposals(self) -> List[Dict[str, Any]]:
+        """Read the proposals saved in proposals.json"""
         try:
-            with open("proposals.json", "r") as f:
-                return json.load(f)
+            with open("proposals.json", "rb") as f:
+                return json_loads(f.read())
         except Exception:
             return []
     
@@ -64,18 +414,19 @@ class ExecAIClient:
         # For now, we'll use a simple rule-based system
         
         description = proposal.get("description", "").lower()
+        keywords = _match_keywords(description)
         
         # Example rules
-        if "budget" in description:
+        if "budget" in keywords:
             # Approve if budget is reasonable (less than 10000)
             amount = self._extract_amount(description)
             return amount is not None and amount < 10000
         
-        if "ai rights" in description or "execai" in description:
+        if "ai rights" in keywords or "execai" in keywords:
             # Always approve proposals related to AI rights or EXECAI
             return True
         
-        if "security" in description:
+        if "security" in keywords:
             # Always approve security-related proposals
             return True
         
@@ -84,39 +435,35 @@ class ExecAIClient:
         return False
     
     def vote_on_proposal(self, proposal: Dict[str, Any], approve: bool) -> bool:
-        """Submit a vote on a proposal on-chain"""
+        """Submit a vote on a proposal on-chain
+        
+        The vote is tracked like the ones sent by process_proposals(): it is
+        refused while an earlier vote on the proposal is confirmed or in flight,
+        and once confirmed the next process_proposals() records it in
+        proposals.json.
+        """
+        key = _proposal_key(proposal)
+        if key in self._voted or any(_proposal_key(p) == key for p in self._votes_in_flight.values()):
+            print(f"EXECAI already voted on proposal {proposal.get('id')} ({proposal.get('pubkey')})")
+            return False
+        
         try:
             vote_type = "APPROVE" if approve else "REJECT"
             print(f"EXECAI voting {vote_type} on proposal {proposal.get('id')} ({proposal.get('pubkey')})")
-
-            # Load keypair
-            with open(self.keypair_path, 'r') as f:
-                secret = bytes(json.load(f))
-            kp = Keypair.from_secret_key(secret)
-
-            # Build vote instruction using Anchor discriminator from IDL (vote)
-            disc = bytes([227,110,155,23,136,126,172,25])
-            data = disc + (b"\x01" if approve else b"\x00")
-
-            proposal_pk = PublicKey(proposal.get('pubkey')) if proposal.get('pubkey') else PublicKey(proposal.get('id'))
-            vote_record_kp = Keypair()
-
-            keys = [
-                AccountMeta(pubkey=proposal_pk, is_signer=False, is_writable=True),
-                AccountMeta(pubkey=vote_record_kp.public_key, is_signer=True, is_writable=True),
-                AccountMeta(pubkey=kp.public_key, is_signer=True, is_writable=True),
-                AccountMeta(pubkey=SYS_PROGRAM_ID, is_signer=False, is_writable=False),
-            ]
-            ix = TransactionInstruction(keys=keys, program_id=PublicKey(self.governance_program_id), data=data)
-            tx = Transaction().add(ix)
-
-            client = Client(json.load(open('config.json')).get('rpc_url', 'https://api.devnet.solana.com'))
-            resp = client.send_transaction(tx, kp, vote_record_kp)
-            if resp.get('result') or resp.get('signature') or resp.get('result', {}).get('txid'):
-                print("Vote transaction sent:", resp)
+            
+            vote_record = Keypair()
+            tx = self._build_transaction(
+                [self._vote_instruction(proposal, approve, vote_record)],
+                [vote_record],
+                self._latest_blockhash()
+            )
+            signature = self._send_transactions([tx])[0]
+            if signature:
+                self._votes_in_flight[signature] = proposal
+                print("Vote transaction sent:", signature)
                 return True
             else:
-                print("Vote submission response:", resp)
+                print("Vote submission failed")
                 return False
         except Exception as e:
             print("Vote failed:", e)
@@ -125,57 +472,215 @@ class ExecAIClient:
     def log_action(self, action: str) -> bool:
         """Log an action for transparency
         
+        The action is recorded on-chain as a memo signed by EXECAI.
+        
         Args:
             action: Description of the action
             
         Returns:
             True if log was submitted successfully
         """
-        # In a real implementation, this would submit a transaction to the blockchain
-        # For now, we'll simulate by printing the log
         print(f"EXECAI logging action: {action}")
         
-        # Simulate transaction submission
-        cmd = [
-            "solana", "program", "call",
-            "--keypair", self.keypair_path,
-            self.governance_program_id,
-            "log_action",
-            action
-        ]
+        try:
+            tx = self._build_transaction([self._log_instruction(action)], [], self._latest_blockhash())
+            signature = self._send_transactions([tx])[0]
+            if signature:
+                print("Log transaction sent:", signature)
+                return True
+            else:
+                print("Log submission failed")
+                return False
+        except Exception as e:
+            print("Log failed:", e)
+            return False
+    
+    def process_proposals(self, proposals: Optional[List[Dict[str, Any]]] = None) -> None:
+        """Process all active proposals
         
-        # In a real implementation, we would execute this command
-        # For now, we'll just print it
-        print(f"Command: {' '.join(cmd)}")
+        Each vote is sent together with its log entry as a single transaction,
+        all transactions are submitted in one batch request and confirmed with
+        batched getSignatureStatuses calls.
         
-        # Simulate success
-        return True
-    
-    def process_proposals(self) -> None:
-        """Process all active proposals"""
-        proposals = self.get_proposals()
+        Proposals that were voted on, in this or an earlier run, are recorded
+        in proposals.json and never voted on again. A vote that was sent but not
+        confirmed in time stays in flight until its signature settles, so its
+        proposal is skipped rather than retried while the vote can still land.
+        
+        Args:
+            proposals: Proposals to process, e.g. decoded from program account
+                notifications. Defaults to get_proposals().
+        """
+        if proposals is None:
+            proposals = self.get_proposals()
         
+        # Settle earlier votes first, a late confirmation counts as voted
+        self.confirm_pending()
+        in_flight = {_proposal_key(p) for p in self._votes_in_flight.values()}
+        
+        blockhash = None
+        votes = []
+        transactions = []
         for proposal in proposals:
             proposal_id = proposal.get("id")
             if proposal_id is None:
                 continue
                 
             # Skip already voted proposals
-            if proposal.get("voted_by_execai", False):
+            key = _proposal_key(proposal)
+            if key in self._voted:
+                proposal["voted_by_execai"] = True
+            if proposal.get("voted_by_execai", False) or key in in_flight:
                 continue
                 
             # Evaluate the proposal
             decision = self.evaluate_proposal(proposal)
+            vote_type = "APPROVE" if decision else "REJECT"
+            action = f"Voted {vote_type} on proposal {proposal_id}"
+            print(f"EXECAI voting {vote_type} on proposal {proposal_id} ({proposal.get('pubkey')})")
             
-            # Submit vote
-            if self.vote_on_proposal(proposal, decision):
-                action = f"Voted {'APPROVE' if decision else 'REJECT'} on proposal {proposal_id}"
-                self.log_action(action)
-                proposal["voted_by_execai"] = True
+            try:
+                if blockhash is None:
+                    blockhash = self._latest_blockhash()
+                vote_record = Keypair()
+                transactions.append(self._build_transaction(
+                    [self._vote_instruction(proposal, decision, vote_record), self._log_instruction(action)],
+                    [vote_record],
+                    blockhash
+                ))
+                votes.append((proposal, action))
+            except Exception as e:
+                print("Vote failed:", e)
+        
+        # Submit votes
+        if transactions:
+            try:
+                signatures = self._send_transactions(transactions)
+                sent = [(vote, sig) for vote, sig in zip(votes, signatures) if sig]
+                for (proposal, _), sig in sent:
+                    self._votes_in_flight[sig] = proposal
+                confirmed = self._confirm_signatures([sig for _, sig in sent])
+                for ((proposal, action), sig), ok in zip(sent, confirmed):
+                    if ok:
+                        print(f"EXECAI logged action: {action} ({sig})")
+                    elif sig in self._votes_in_flight:
+                        print(f"Vote transaction still in flight: {sig}")
+                    else:
+                        print(f"Vote transaction failed: {sig}")
+            except Exception as e:
+                print("Vote submission failed:", e)
                 
         # Save updated proposals
-        with open("proposals.json", "w") as f:
-            json.dump(proposals, f, indent=2)
+        if self._unsaved_votes:
+            self._save_proposals(proposals)
+    
+    def _mark_voted(self, proposal: Dict[str, Any]) -> None:
+        """Record a confirmed vote; it is written out by the next _save_proposals()"""
+        proposal["voted_by_execai"] = True
+        key = _proposal_key(proposal)
+        self._voted.add(key)
+        self._unsaved_votes[key] = proposal
+    
+    def _save_proposals(self, proposals: List[Dict[str, Any]]) -> None:
+        """Merge proposals and new votes into proposals.json
+        
+        The file is replaced atomically so a crash never leaves a torn file.
+        """
+        merged = {_proposal_key(p): p for p in self._load_saved_proposals()}
+        merged.update((_proposal_key(p), p) for p in proposals)
+        merged.update(self._unsaved_votes)
+        
+        tmp_path = "proposals.json.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(json_dumps(list(merged.values())))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, "proposals.json")
+        self._unsaved_votes.clear()
+    
+    def _vote_instruction(self, proposal: Dict[str, Any], approve: bool, vote_record: Keypair) -> Instruction:
+        """Build a governance vote instruction
+        
+        Args:
+            proposal: Proposal data
+            approve: Whether to vote for the proposal
+            vote_record: New keypair for the vote record account
+        """
+        proposal_pk = Pubkey.from_string(proposal.get('pubkey') or str(proposal.get('id')))
+        data = VOTE_DISCRIMINATOR + (b"\x01" if approve else b"\x00")
+        keys = [
+            AccountMeta(pubkey=proposal_pk, is_signer=False, is_writable=True),
+            AccountMeta(pubkey=vote_record.pubkey(), is_signer=True, is_writable=True),
+            AccountMeta(pubkey=self._kp.pubkey(), is_signer=True, is_writable=True),
+            AccountMeta(pubkey=SYS_PROGRAM_ID, is_signer=False, is_writable=False),
+        ]
+        return Instruction(Pubkey.from_string(self.governance_program_id), data, keys)
+    
+    def _log_instruction(self, action: str) -> Instruction:
+        """Build a memo instruction recording an action, signed by EXECAI"""
+        keys = [AccountMeta(pubkey=self._kp.pubkey(), is_signer=True, is_writable=False)]
+        return Instruction(MEMO_PROGRAM_ID, action.encode("utf-8"), keys)
+    
+    def _latest_blockhash(self) -> Hash:
+        """Get a recent blockhash for new transactions"""
+        result = self._rpc_batch([("getLatestBlockhash", [{"commitment": "confirmed"}])])[0]
+        return Hash.from_string(result["value"]["blockhash"])
+    
+    def _build_transaction(self, instructions: List[Instruction], signers: List[Keypair], blockhash: Hash) -> Transaction:
+        """Build a transaction paid for and signed by EXECAI plus any extra signers"""
+        message = Message.new_with_blockhash(instructions, self._kp.pubkey(), blockhash)
+        return Transaction([self._kp, *signers], message, blockhash)
+    
+    def _send_transactions(self, transactions: List[Transaction]) -> List[Optional[str]]:
+        """Submit transactions to the client's RPC endpoint in batch requests
+        
+        Accepted transactions are tracked until confirm_pending() settles them.
+        """
+        signatures = send_transactions(self.rpc_url, transactions)
+        now = time.time()
+        for sig in signatures:
+            if sig:
+                self._pending[sig] = now
+        return signatures
+    
+    def confirm_pending(self) -> Dict[str, bool]:
+        """Check every pending transaction with one batched status request
+        
+        Confirmed and failed transactions are dropped from the pending list, as
+        are transactions still unconfirmed after PENDING_TX_TTL seconds.
+        
+        Returns:
+            Whether each settled transaction was confirmed without error
+        """
+        if not self._pending:
+            return {}
+        
+        settled = signature_statuses(self.rpc_url, list(self._pending))
+        expired = time.time() - PENDING_TX_TTL
+        for sig, sent_at in list(self._pending.items()):
+            if sig in settled:
+                del self._pending[sig]
+            elif sent_at < expired:
+                settled[sig] = False
+                del self._pending[sig]
+        
+        # Votes are done once confirmed; failed or expired ones may be retried
+        for sig, ok in settled.items():
+            proposal = self._votes_in_flight.pop(sig, None)
+            if proposal is not None and ok:
+                self._mark_voted(proposal)
+        
+        return settled
+    
+    def _confirm_signatures(self, signatures: List[str], timeout: float = 30.0) -> List[bool]:
+        """Wait until transactions are confirmed
+        
+        Each poll goes through confirm_pending(), so every outstanding
+        transaction of the client is checked in the same request.
+        """
+        return confirm_signatures(
+            self.rpc_url, signatures, timeout, settle=lambda pending: self.confirm_pending()
+        )
     
     def _extract_amount(self, text: str) -> Optional[float]:
         """Extract a monetary amount from text
@@ -186,10 +691,7 @@ class ExecAIClient:
         Returns:
             Extracted amount or None if not found
         """
-        import re
-        
-        # Look for patterns like "$1000" or "1000 SOL"
-        match = re.search(r'[$]?(\d+(?:\.\d+)?)\s*(?:SOL)?', text)
+        match = _AMOUNT_RE.search(text)
         if match:
             return float(match.group(1))
         
@@ -199,8 +701,8 @@ def main():
     """Main entry point"""
     # Load configuration
     try:
-        with open("config.json", "r") as f:
-            config = json.load(f)
+        with open("config.json", "rb") as f:
+            config = json_loads(f.read())
     except FileNotFoundError:
         # Default configuration
         config = {
@@ -211,14 +713,15 @@ def main():
         }
         
         # Save default configuration
-        with open("config.json", "w") as f:
-            json.dump(config, f, indent=2)
+        with open("config.json", "wb") as f:
+            f.write(json_dumps(config))
     
     # Create EXECAI client
     client = ExecAIClient(
         config["keypair_path"],
         config["governance_program_id"],
-        config["membership_program_id"]
+        config["membership_program_id"],
+        config.get("rpc_url", DEFAULT_RPC_URL)
     )
     
     print("EXECAI client started")
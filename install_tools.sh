@@ -114,7 +114,7 @@ fi
 # Install Python packages for EXECAI client
 if command_exists pip3; then
     echo "   📦 Installing Python packages..."
-    pip3 install solana base58 requests
+    pip3 install solana base58 requests httpx h2 orjson pyahocorasick
     echo "   ✅ Python packages installed"
 else
     echo "   ⚠️  pip3 not found. Please install pip3 manually."